@@ -7,11 +7,22 @@ Loads .env.local so OPENSEARCH_* and OPENAI_API_KEY are available.
 Usage (from law-rag-app/):
   source .venv/bin/activate   # or: .venv\Scripts\activate on Windows
   python scripts/ingest.py
+  python scripts/ingest.py --no-embed   # skip OpenAI; index chunks without vectors (fast schema check)
 """
-import json
+import argparse
+import hashlib
+import itertools
 import os
+import random
+import re
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 # Load env before importing openai/opensearch
 from dotenv import load_dotenv
@@ -19,16 +30,44 @@ load_dotenv(".env.local")
 load_dotenv()
 
 try:
+    import ijson
+    import numpy as np
+    import orjson
+    import tiktoken
     from opensearchpy import OpenSearch
-    from opensearchpy.exceptions import ConflictError, RequestError
-    from openai import OpenAI
+    from opensearchpy.exceptions import ConflictError, ConnectionTimeout, RequestError, SerializationError
+    from opensearchpy.serializer import JSONSerializer
+    from openai import OpenAI, RateLimitError
 except ImportError as e:
     print("Install dependencies: pip install -r requirements-ingest.txt", file=sys.stderr)
     raise SystemExit(1) from e
 
+try:
+    import ahocorasick
+except ImportError:
+    # Optional: without it, entity matching falls back to a single compiled regex
+    ahocorasick = None
+
 # Constants
 DIMENSION = 1536
 EMBEDDING_MODEL = "text-embedding-3-small"
+# OpenAI embeddings accept up to 8191 tokens per input, 2048 inputs and 300K tokens per request
+MAX_INPUT_TOKENS = 8191
+EMBED_BATCH_SIZE = 128
+MAX_REQUEST_TOKENS = 300_000
+# Batches in flight at once; kept modest to stay clear of rate limits
+EMBED_CONCURRENCY = 5
+EMBED_MAX_RETRIES = 5
+# parallel_bulk threads; each needs its own pooled HTTP connection
+BULK_THREAD_COUNT = 4
+BULK_CHUNK_SIZE = 500
+# Index settings while bulk loading (no refreshes, replicas or per-request fsync); each index's
+# prior values are restored afterwards
+BULK_LOAD_SETTINGS = {
+    "index.refresh_interval": "-1",
+    "index.number_of_replicas": 0,
+    "index.translog.durability": "async",
+}
 LAW_INDICES = {
     "chunks": "law_chunks",
     "entities": "law_entities",
@@ -37,6 +76,20 @@ LAW_INDICES = {
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 DATA_PATH = SCRIPT_DIR.parent / "data" / "law-cases.json"
+# Raw float32 embeddings keyed by text_digest(); makes re-runs skip the API for unchanged chunks
+CACHE_DIR = SCRIPT_DIR / ".emb_cache"
+
+
+class ORJSONSerializer(JSONSerializer):
+    """JSONSerializer backed by orjson; encodes numpy embeddings natively, without tolist()."""
+
+    def dumps(self, data: Any) -> str:
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+        except orjson.JSONEncodeError as e:
+            raise SerializationError(data, e)
 
 
 def get_opensearch_client():
@@ -64,17 +117,156 @@ def get_opensearch_client():
         use_ssl=use_ssl,
         verify_certs=not insecure,
         ssl_show_warn=False,
+        pool_maxsize=BULK_THREAD_COUNT * 2,
+        serializer=ORJSONSerializer(),
     )
 
 
-def get_embedding(client: OpenAI, text: str) -> list[float]:
-    if not client:
-        return [0.0] * DIMENSION
-    resp = client.embeddings.create(
-        model=EMBEDDING_MODEL,
-        input=text[:8000],
-    )
-    return resp.data[0].embedding
+def text_digest(text: str) -> bytes:
+    """Content key for an embedding input; includes the model so a model change misses the cache."""
+    return hashlib.blake2b(f"{EMBEDDING_MODEL}\0{text}".encode("utf-8"), digest_size=16).digest()
+
+
+def embedding_cache_path(text_key: bytes) -> Path:
+    name = text_key.hex()
+    # Shard by first byte so no single directory grows too large
+    return CACHE_DIR / name[:2] / f"{name}.f32"
+
+
+def load_cached_embedding(text_key: bytes) -> Optional[np.ndarray]:
+    try:
+        emb = np.fromfile(embedding_cache_path(text_key), dtype=np.float32)
+    except OSError:
+        # Missing or unreadable files are cache misses; the cache is only an optimization
+        return None
+    # Ignore truncated or foreign files rather than indexing a bad vector
+    return emb if emb.size == DIMENSION else None
+
+
+def save_cached_embedding(text_key: bytes, emb: np.ndarray) -> None:
+    path = embedding_cache_path(text_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        emb.astype(np.float32, copy=False).tofile(tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=1)
+def get_encoding() -> "tiktoken.Encoding":
+    return tiktoken.encoding_for_model(EMBEDDING_MODEL)
+
+
+def get_embeddings_batch(client: OpenAI, texts: list[str]) -> list[np.ndarray]:
+    for attempt in range(EMBED_MAX_RETRIES + 1):
+        try:
+            resp = client.embeddings.create(
+                model=EMBEDDING_MODEL,
+                input=texts,
+            )
+            break
+        except RateLimitError:
+            if attempt == EMBED_MAX_RETRIES:
+                raise
+            # Exponential backoff with jitter so concurrent batches don't retry in lockstep
+            time.sleep(2 ** attempt + random.random())
+    # Packed float32 is ~10x smaller than a list of boxed Python floats; orjson serializes it directly
+    return [np.asarray(d.embedding, dtype=np.float32) for d in sorted(resp.data, key=lambda d: d.index)]
+
+
+class ChunkEmbedder:
+    """Embeds chunk texts in background batches while the caller keeps walking cases.
+
+    Texts are deduplicated by digest and served from the on-disk cache when possible. The rest
+    are grouped into token-budgeted batches, each submitted to a thread pool as soon as it fills.
+    Use as a context manager so queued batches are cancelled if the caller fails before finish().
+    """
+
+    def __init__(self, client: OpenAI, use_cache: bool = True):
+        self.client = client
+        self.use_cache = use_cache
+        self.total = 0
+        self.duplicates = 0
+        self.cache_hits = 0
+        self._embeddings: dict[bytes, np.ndarray] = {}
+        self._seen: set[bytes] = set()
+        self._batch_keys: list[bytes] = []
+        self._batch_texts: list[str] = []
+        self._batch_tokens = 0
+        self._futures: list[Future] = []
+        self._cache_writable = True
+        self._cache_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=EMBED_CONCURRENCY)
+
+    def add(self, text: str) -> bytes:
+        """Queue text for embedding and return its key into the map returned by finish().
+
+        The key is taken from the untruncated text so duplicates and cache hits skip tokenization.
+        """
+        text_key = text_digest(text)
+        self.total += 1
+        if text_key in self._seen:
+            self.duplicates += 1
+            return text_key
+        self._seen.add(text_key)
+        cached = load_cached_embedding(text_key) if self.use_cache else None
+        if cached is not None:
+            self.cache_hits += 1
+            self._embeddings[text_key] = cached
+            return text_key
+
+        # Truncate by tokens, not characters, so inputs use the model's full context but never exceed it
+        enc = get_encoding()
+        tokens = enc.encode(text, disallowed_special=())
+        if len(tokens) > MAX_INPUT_TOKENS:
+            tokens = tokens[:MAX_INPUT_TOKENS]
+            text = enc.decode(tokens)
+        n_tokens = len(tokens)
+        if self._batch_texts and (
+            len(self._batch_texts) >= EMBED_BATCH_SIZE or self._batch_tokens + n_tokens > MAX_REQUEST_TOKENS
+        ):
+            self._submit_batch()
+        self._batch_keys.append(text_key)
+        self._batch_texts.append(text)
+        self._batch_tokens += n_tokens
+        return text_key
+
+    def __enter__(self) -> "ChunkEmbedder":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        # Drop batches not yet started rather than paying for embeddings that will be discarded
+        self._executor.shutdown(cancel_futures=True)
+
+    def finish(self) -> dict[bytes, np.ndarray]:
+        """Wait for all in-flight batches and return embeddings keyed by text digest."""
+        self._submit_batch()
+        for future in self._futures:
+            self._embeddings.update(future.result())
+        return self._embeddings
+
+    def _submit_batch(self) -> None:
+        if self._batch_texts:
+            self._futures.append(self._executor.submit(self._embed_batch, self._batch_keys, self._batch_texts))
+        self._batch_keys, self._batch_texts, self._batch_tokens = [], [], 0
+
+    def _embed_batch(self, keys: list[bytes], texts: list[str]) -> list[tuple[bytes, np.ndarray]]:
+        embeddings = get_embeddings_batch(self.client, texts)
+        for text_key, emb in zip(keys, embeddings):
+            if not self._cache_writable:
+                break
+            try:
+                save_cached_embedding(text_key, emb)
+            except OSError as e:
+                # A read-only checkout or full disk must not discard embeddings already paid for
+                with self._cache_lock:
+                    if self._cache_writable:
+                        self._cache_writable = False
+                        print(f"Warning: not writing embedding cache ({e}); continuing without it", file=sys.stderr)
+        return list(zip(keys, embeddings))
 
 
 def create_indices(client: OpenSearch) -> None:
@@ -144,155 +336,253 @@ def create_indices(client: OpenSearch) -> None:
                 raise
 
 
+def iter_cases(path: Path) -> Iterator[dict]:
+    """Stream cases from the data file one at a time instead of loading it whole."""
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "cases.item", use_float=True)
+
+
+def apply_bulk_load_settings(client: OpenSearch) -> dict[str, dict]:
+    """Apply BULK_LOAD_SETTINGS to the law indices and return each index's prior values."""
+    indices = ",".join(LAW_INDICES.values())
+    current = client.indices.get_settings(index=indices, flat_settings=True)
+    # Settings left at their default are absent here; None resets them on restore
+    prior = {
+        name: {key: body["settings"].get(key) for key in BULK_LOAD_SETTINGS}
+        for name, body in current.items()
+    }
+    client.indices.put_settings(index=indices, body=BULK_LOAD_SETTINGS)
+    return prior
+
+
+def restore_index_settings(client: OpenSearch, prior: dict[str, dict]) -> None:
+    for name, settings in prior.items():
+        client.indices.put_settings(index=name, body=settings)
+
+
 def build_entity_key(name: str, entity_type: str) -> str:
     return f"{name}|{entity_type}"
 
 
+def build_entity_id(entity_key: str) -> str:
+    # Derived from the key rather than insertion order, so re-ingests update the same documents
+    return "ent_" + hashlib.blake2b(entity_key.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def build_name_matcher(names: Iterable[str]) -> Callable[[str], set[str]]:
+    """Return a function giving the subset of names that occur in a text."""
+    names = set(names)
+    if not names:
+        return lambda text: set()
+    if ahocorasick is None:
+        return build_regex_name_matcher(names)
+    # One automaton per case: each chunk is scanned once for all names
+    automaton = ahocorasick.Automaton()
+    for name in names:
+        automaton.add_word(name, name)
+    automaton.make_automaton()
+    return lambda text: {name for _, name in automaton.iter(text)}
+
+
+def build_regex_name_matcher(names: set[str]) -> Callable[[str], set[str]]:
+    """Fallback matcher: one compiled alternation scanned over each text by the C regex engine."""
+    # The lookahead tries every start position, longest name first, so overlapping names are seen
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True)) + "))"
+    )
+    # A shorter name starting where a longer one matched is shadowed; add back names nested in each hit
+    nested = {name: {other for other in names if other != name and other in name} for name in names}
+
+    def match(text: str) -> set[str]:
+        found = set(pattern.findall(text))
+        for name in list(found):
+            found |= nested[name]
+        return found
+
+    return match
+
+
+# Bulk actions are generated lazily so only parallel_bulk's in-flight chunks are materialized.
+# The working dicts already hold exactly the mapped fields, so they are sent as _source without copying.
+def iter_chunk_actions(chunk_docs: Iterable[dict]) -> Iterator[dict]:
+    for doc in chunk_docs:
+        yield {"_index": LAW_INDICES["chunks"], "_id": doc["element_id"], "_source": doc}
+
+
+def iter_entity_actions(entities: Iterable[dict]) -> Iterator[dict]:
+    for ent in entities:
+        # Built as a set for O(1) membership checks; emitted as a stable list
+        ent["source_element_ids"] = sorted(ent["source_element_ids"])
+        yield {"_index": LAW_INDICES["entities"], "_id": ent["entity_id"], "_source": ent}
+
+
+def iter_relationship_actions(relationship_docs: Iterable[dict]) -> Iterator[dict]:
+    for i, r in enumerate(relationship_docs, start=1):
+        yield {"_index": LAW_INDICES["relationships"], "_id": f"rel_{i:03d}", "_source": r}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ingest law cases into OpenSearch.")
+    parser.add_argument(
+        "--no-embed",
+        action="store_true",
+        help="Skip OpenAI embeddings and index chunks without vectors (fast schema/mapping check)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Re-embed every chunk instead of reading cached embeddings from {CACHE_DIR.name}/",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
+    args = parse_args()
     if not DATA_PATH.exists():
         print(f"Data file not found: {DATA_PATH}", file=sys.stderr)
         sys.exit(1)
 
-    with open(DATA_PATH, encoding="utf-8") as f:
-        data = json.load(f)
-    cases = data["cases"]
-
     os_client = get_opensearch_client()
-    openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY")) if os.environ.get("OPENAI_API_KEY") else None
+    openai_client = None
+    if not args.no_embed and os.environ.get("OPENAI_API_KEY"):
+        openai_client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+    embedder = None
+    if openai_client is None:
+        # knn_vector is optional per document, and cosinesimil rejects all-zero vectors anyway
+        print("Embeddings disabled (--no-embed or no OPENAI_API_KEY); indexing chunks without text_embedding.")
+    else:
+        embedder = ChunkEmbedder(openai_client, use_cache=not args.no_cache)
 
     create_indices(os_client)
 
     entity_map: dict[str, dict] = {}
+    # First entity registered under each name; doubles as the set of known names.
+    # Chunk mentions are attributed to this entity.
+    entities_by_name: dict[str, dict] = {}
     relationship_docs: list[dict] = []
     chunk_docs: list[dict] = []
-    entity_counter = 0
-
-    for c in cases:
-        first_chunk = c["chunks"][0] if c["chunks"] else {}
-        snippet = (first_chunk.get("text") or "")[:500]
-        fn = c["filename"]
-        page = first_chunk.get("page_number", 1)
-        elem_id_0 = first_chunk.get("element_id", "")
-
-        for e in c["entities"]:
-            key = build_entity_key(e["entity"], e["type"])
-            if key not in entity_map:
-                entity_counter += 1
-                entity_map[key] = {
-                    "entity_id": f"ent_{entity_counter:03d}",
-                    "entity_name": e["entity"],
-                    "entity_type": e["type"],
-                    "source_element_ids": [],
-                    "source_text_snippet": snippet,
-                    "filename": fn,
-                    "page_number": page,
-                }
-
-        def name_exists(name: str) -> bool:
-            return any(ent["entity_name"] == name for ent in entity_map.values())
-
-        for r in c["relationships"]:
-            for name in (r["from"], r["to"]):
-                if not name_exists(name):
-                    entity_counter += 1
-                    entity_map[build_entity_key(name, "ENTITY")] = {
-                        "entity_id": f"ent_{entity_counter:03d}",
-                        "entity_name": name,
-                        "entity_type": "ENTITY",
-                        "source_element_ids": [],
+    # Embedding keys aligned with chunk_docs
+    chunk_text_keys: list[bytes] = []
+
+    # The context is a no-op without an embedder; with one, a failure in the walk cancels queued batches
+    with embedder or nullcontext():
+        for c in iter_cases(DATA_PATH):
+            first_chunk = c["chunks"][0] if c["chunks"] else {}
+            snippet = (first_chunk.get("text") or "")[:500]
+            fn = c["filename"]
+            page = first_chunk.get("page_number", 1)
+            elem_id_0 = first_chunk.get("element_id", "")
+
+            for e in c["entities"]:
+                key = build_entity_key(e["entity"], e["type"])
+                if key not in entity_map:
+                    entity_map[key] = {
+                        "entity_id": build_entity_id(key),
+                        "entity_name": e["entity"],
+                        "entity_type": e["type"],
+                        "source_element_ids": set(),
                         "source_text_snippet": snippet,
                         "filename": fn,
                         "page_number": page,
                     }
-            relationship_docs.append({
-                "from_entity": r["from"],
-                "to_entity": r["to"],
-                "relationship_type": r["relationship"],
-                "source_element_id": elem_id_0,
-                "source_text_snippet": snippet,
-                "filename": fn,
-                "page_number": page,
-            })
-
-        for ch in c["chunks"]:
-            entity_names = [e["entity"] for e in c["entities"] if e["entity"] in ch["text"]]
-            rel_entities = set()
+                    entities_by_name.setdefault(e["entity"], entity_map[key])
+
             for r in c["relationships"]:
-                if r["from"] in ch["text"] or r["to"] in ch["text"]:
-                    rel_entities.add(r["from"])
-                    rel_entities.add(r["to"])
-            all_names = list(dict.fromkeys(entity_names + list(rel_entities)))
-
-            emb = get_embedding(openai_client, ch["text"])
-            chunk_docs.append({
-                "element_id": ch["element_id"],
-                "text": ch["text"],
-                "filename": fn,
-                "page_number": ch.get("page_number", 1),
-                "entity_names": all_names,
-                "text_embedding": emb,
-            })
-            for name in all_names:
-                for ent in entity_map.values():
-                    if ent["entity_name"] == name:
-                        if ch["element_id"] not in ent["source_element_ids"]:
-                            ent["source_element_ids"].append(ch["element_id"])
-                        break
+                for name in (r["from"], r["to"]):
+                    if name not in entities_by_name:
+                        key = build_entity_key(name, "ENTITY")
+                        ent = {
+                            "entity_id": build_entity_id(key),
+                            "entity_name": name,
+                            "entity_type": "ENTITY",
+                            "source_element_ids": set(),
+                            "source_text_snippet": snippet,
+                            "filename": fn,
+                            "page_number": page,
+                        }
+                        entity_map[key] = ent
+                        entities_by_name[name] = ent
+                relationship_docs.append({
+                    "from_entity": r["from"],
+                    "to_entity": r["to"],
+                    "relationship_type": r["relationship"],
+                    "source_element_id": elem_id_0,
+                    "source_text_snippet": snippet,
+                    "filename": fn,
+                    "page_number": page,
+                })
+
+            match_names = build_name_matcher(
+                [e["entity"] for e in c["entities"]]
+                + [name for r in c["relationships"] for name in (r["from"], r["to"])]
+            )
+            for ch in c["chunks"]:
+                found = match_names(ch["text"])
+                entity_names = [e["entity"] for e in c["entities"] if e["entity"] in found]
+                rel_entities = set()
+                for r in c["relationships"]:
+                    if r["from"] in found or r["to"] in found:
+                        rel_entities.add(r["from"])
+                        rel_entities.add(r["to"])
+                all_names = list(dict.fromkeys(entity_names + list(rel_entities)))
+
+                # Embeddings run in the background; text_embedding is added once all batches finish
+                chunk_docs.append({
+                    "element_id": ch["element_id"],
+                    "text": ch["text"],
+                    "filename": fn,
+                    "page_number": ch.get("page_number", 1),
+                    "entity_names": all_names,
+                })
+                if embedder is not None:
+                    chunk_text_keys.append(embedder.add(ch["text"]))
+                for name in all_names:
+                    ent = entities_by_name.get(name)
+                    if ent is not None:
+                        ent["source_element_ids"].add(ch["element_id"])
+
+        if embedder is not None:
+            embeddings = embedder.finish()
+            print(f"Deduplicated {embedder.duplicates}/{embedder.total} chunks before embedding")
+            print(f"Embedding cache: {embedder.cache_hits} hits, {len(embeddings) - embedder.cache_hits} embedded")
+            for doc, text_key in zip(chunk_docs, chunk_text_keys):
+                doc["text_embedding"] = embeddings[text_key]
 
     # Bulk index (opensearch-py helpers expect one dict per doc: _index, _id, _source)
     from opensearchpy import helpers
 
-    bulk_actions = []
-    for doc in chunk_docs:
-        bulk_actions.append({
-            "_index": LAW_INDICES["chunks"],
-            "_id": doc["element_id"],
-            "_source": {
-                "element_id": doc["element_id"],
-                "text": doc["text"],
-                "filename": doc["filename"],
-                "page_number": doc["page_number"],
-                "entity_names": doc["entity_names"],
-                "text_embedding": doc["text_embedding"],
-            },
-        })
-    for ent in entity_map.values():
-        bulk_actions.append({
-            "_index": LAW_INDICES["entities"],
-            "_id": ent["entity_id"],
-            "_source": {
-                "entity_id": ent["entity_id"],
-                "entity_name": ent["entity_name"],
-                "entity_type": ent["entity_type"],
-                "source_element_ids": ent["source_element_ids"],
-                "source_text_snippet": ent["source_text_snippet"],
-                "filename": ent["filename"],
-                "page_number": ent["page_number"],
-            },
-        })
-    for i, r in enumerate(relationship_docs, start=1):
-        bulk_actions.append({
-            "_index": LAW_INDICES["relationships"],
-            "_id": f"rel_{i:03d}",
-            "_source": {
-                "from_entity": r["from_entity"],
-                "to_entity": r["to_entity"],
-                "relationship_type": r["relationship_type"],
-                "source_element_id": r["source_element_id"],
-                "source_text_snippet": r["source_text_snippet"],
-                "filename": r["filename"],
-                "page_number": r["page_number"],
-            },
-        })
-
-    success, errors = helpers.bulk(
-        os_client, bulk_actions, refresh=True, raise_on_error=False, request_timeout=60
+    bulk_actions = itertools.chain(
+        iter_chunk_actions(chunk_docs),
+        iter_entity_actions(entity_map.values()),
+        iter_relationship_actions(relationship_docs),
     )
-    if errors:
-        for err in errors:
-            print("Bulk error:", err, file=sys.stderr)
-    else:
+    error_count = 0
+    prior_settings = apply_bulk_load_settings(os_client)
+    try:
+        for ok, item in helpers.parallel_bulk(
+            os_client,
+            bulk_actions,
+            thread_count=BULK_THREAD_COUNT,
+            chunk_size=BULK_CHUNK_SIZE,
+            raise_on_error=False,
+            request_timeout=60,
+        ):
+            if not ok:
+                error_count += 1
+                print("Bulk error:", item, file=sys.stderr)
+    finally:
+        restore_index_settings(os_client, prior_settings)
+    # refresh_interval was off during the load; make everything searchable once, then compact segments
+    law_indices = list(LAW_INDICES.values())
+    os_client.indices.refresh(index=law_indices)
+    if not error_count:
         print(f"Indexed {len(chunk_docs)} chunks, {len(entity_map)} entities, {len(relationship_docs)} relationships.")
+    try:
+        os_client.indices.forcemerge(index=law_indices, max_num_segments=1, request_timeout=600)
+    except ConnectionTimeout:
+        # The merge keeps running on the cluster; the indices are already searchable
+        print("Force merge is still running on the cluster; not waiting for it to finish.")
 
 
 if __name__ == "__main__":